@@ -2,6 +2,7 @@ import os
 import zipfile
 import tempfile
 import io
+from dataclasses import dataclass
 from typing import Callable, Optional
 
 import tiktoken
@@ -26,6 +27,25 @@ except Exception:  # pragma: no cover
     except Exception:  # pragma: no cover
         get_openai_callback = None
 
+@dataclass(frozen=True)
+class IngestEvent:
+    """Structured progress event emitted during vectorization.
+
+    kind is one of "document", "chunk" or "summary". `message` is the
+    human-readable markdown line; the remaining fields feed aggregated counters.
+    """
+
+    kind: str
+    file: str
+    message: str
+    chunks: int = 0
+    tokens: int = 0
+    api_tokens: Optional[int] = None
+
+
+EventFn = Callable[[IngestEvent], None]
+
+
 def _read_document(file_path):
     file_extension = os.path.splitext(file_path)[1].lower()
     if file_extension == ".pdf":
@@ -55,14 +75,21 @@ def _process_file(
     embedding_model_name: str,
     chunk_size: int,
     overlap: int,
-    log_fn: Optional[Callable[[str], None]] = None,
+    event_fn: Optional[EventFn] = None,
 ):
     documents = _read_document(file_path)
     for doc_i, document in enumerate(documents, start=1):
         chunks = chunk_text(document.page_content, chunk_size, overlap)
-        if log_fn:
-            log_fn(
-                f"**Arquivo:** `{display_name}` | **Doc:** {doc_i}/{len(documents)} | **Chunks:** {len(chunks)}"
+        if event_fn:
+            event_fn(
+                IngestEvent(
+                    kind="document",
+                    file=display_name,
+                    message=(
+                        f"**Arquivo:** `{display_name}` | **Doc:** {doc_i}/{len(documents)} | **Chunks:** {len(chunks)}"
+                    ),
+                    chunks=len(chunks),
+                )
             )
 
         chunk_token_counts = [
@@ -83,26 +110,42 @@ def _process_file(
 
         running_tokens = 0
         for i, chunk in enumerate(chunks):
-            insert_document(chunk, embeddings[i])
+            insert_document(chunk, embeddings[i], collection=display_name)
             running_tokens += chunk_token_counts[i]
-            if log_fn:
+            if event_fn:
                 snippet = " ".join(chunk.strip().split())[:120]
                 snippet = snippet.replace("`", "\\`")
-                log_fn(
-                    "- "
-                    f"**Chunk {i + 1}/{len(chunks)}** — "
-                    f"tokens: `{chunk_token_counts[i]}` (Σ `{running_tokens}`) "
-                    f"— _{snippet}_"
+                event_fn(
+                    IngestEvent(
+                        kind="chunk",
+                        file=display_name,
+                        message=(
+                            "- "
+                            f"**Chunk {i + 1}/{len(chunks)}** — "
+                            f"tokens: `{chunk_token_counts[i]}` (Σ `{running_tokens}`) "
+                            f"— _{snippet}_"
+                        ),
+                        tokens=chunk_token_counts[i],
+                    )
                 )
 
-        if log_fn:
+        if event_fn:
             approx_total = sum(chunk_token_counts)
             if embedding_total_tokens is not None:
-                log_fn(
+                message = (
                     f"> **Resumo embeddings:** total_tokens (API) = `{embedding_total_tokens}` | tokens (aprox) = `{approx_total}`"
                 )
             else:
-                log_fn(f"> **Resumo embeddings:** tokens (aprox) = `{approx_total}`")
+                message = f"> **Resumo embeddings:** tokens (aprox) = `{approx_total}`"
+            event_fn(
+                IngestEvent(
+                    kind="summary",
+                    file=display_name,
+                    message=message,
+                    tokens=approx_total,
+                    api_tokens=embedding_total_tokens,
+                )
+            )
 
 
 def process_uploaded_files(
@@ -112,7 +155,7 @@ def process_uploaded_files(
     embedding_model_name,
     progress_bar,
     progress_text,
-    log_fn: Optional[Callable[[str], None]] = None,
+    event_fn: Optional[EventFn] = None,
 ):
     create_table()
 
@@ -160,7 +203,7 @@ def process_uploaded_files(
                             embedding_model_name=embedding_model_name,
                             chunk_size=chunk_size,
                             overlap=overlap,
-                            log_fn=log_fn,
+                            event_fn=event_fn,
                         )
                         processed_units += 1
                         progress_bar.progress(processed_units / total_units)
@@ -175,7 +218,7 @@ def process_uploaded_files(
                     embedding_model_name=embedding_model_name,
                     chunk_size=chunk_size,
                     overlap=overlap,
-                    log_fn=log_fn,
+                    event_fn=event_fn,
                 )
 
                 processed_units += 1
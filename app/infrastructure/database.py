@@ -1,4 +1,10 @@
+import hashlib
+import heapq
+import logging
 import os
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Dict, List, Optional
+
 import psycopg2
 from dotenv import load_dotenv
 from pgvector import Vector
@@ -6,23 +12,90 @@ from pgvector.psycopg2 import register_vector
 
 load_dotenv()
 
-def get_db_connection(register: bool = True):
+logger = logging.getLogger(__name__)
+
+
+def get_shards() -> List[Dict[str, str]]:
+    """Connection settings for every configured pgvector shard.
+
+    DB_SHARDS is a comma-separated list of `host:port[/dbname]` entries sharing
+    DB_USER/DB_PASSWORD. Without it, the single DB_HOST/DB_PORT/DB_NAME instance
+    is the only shard.
+    """
+    default = {
+        "host": os.getenv("DB_HOST"),
+        "port": os.getenv("DB_PORT"),
+        "dbname": os.getenv("DB_NAME"),
+    }
+    raw = os.getenv("DB_SHARDS", "").strip()
+    if not raw:
+        return [default]
+
+    shards = []
+    for entry in raw.split(","):
+        entry = entry.strip()
+        if not entry:
+            continue
+        address, _, dbname = entry.partition("/")
+        host, _, port = address.partition(":")
+        shards.append(
+            {
+                "host": host or default["host"],
+                "port": port or default["port"],
+                "dbname": dbname or default["dbname"],
+            }
+        )
+    return shards or [default]
+
+
+def _shard_timeout() -> float:
+    return float(os.getenv("DB_SHARD_TIMEOUT", "5"))
+
+
+def get_db_connection(register: bool = True, shard: Optional[Dict[str, str]] = None, timeout: Optional[float] = None):
+    shard = shard or get_shards()[0]
+    options = {}
+    if timeout is not None:
+        options["connect_timeout"] = max(1, int(timeout))
+        options["options"] = f"-c statement_timeout={int(timeout * 1000)}"
     conn = psycopg2.connect(
-        host=os.getenv("DB_HOST"),
-        port=os.getenv("DB_PORT"),
-        dbname=os.getenv("DB_NAME"),
+        host=shard["host"],
+        port=shard["port"],
+        dbname=shard["dbname"],
         user=os.getenv("DB_USER"),
-        password=os.getenv("DB_PASSWORD")
+        password=os.getenv("DB_PASSWORD"),
+        **options,
     )
 
     if register:
         register_vector(conn)
     return conn
 
-def create_table():
+
+def shard_for(content: str, collection: Optional[str] = None) -> int:
+    """Pick the shard index for a chunk.
+
+    DB_SHARD_STRATEGY=hash (default) spreads chunks by content hash;
+    DB_SHARD_STRATEGY=collection keeps every chunk of a collection on one shard.
+    """
+    n_shards = len(get_shards())
+    if n_shards == 1:
+        return 0
+    strategy = os.getenv("DB_SHARD_STRATEGY", "hash").lower()
+    key = collection if strategy == "collection" and collection is not None else content
+    digest = hashlib.sha1((key or "").encode("utf-8")).digest()
+    return int.from_bytes(digest[:8], "big") % n_shards
+
+
+def _global_id(local_id: int, shard_index: int, n_shards: int) -> int:
+    # Each shard has its own SERIAL sequence; interleave so ids stay unique ints.
+    return local_id * n_shards + shard_index
+
+
+def _create_table_on(shard):
     # Important: the 'vector' type only exists after the extension is created.
     # register_vector() will fail if called before that.
-    conn = get_db_connection(register=False)
+    conn = get_db_connection(register=False, shard=shard)
     cursor = conn.cursor()
     cursor.execute("CREATE EXTENSION IF NOT EXISTS vector;")
     conn.commit()
@@ -40,8 +113,15 @@ def create_table():
     cursor.close()
     conn.close()
 
-def insert_document(content, embedding):
-    conn = get_db_connection()
+
+def create_table():
+    for shard in get_shards():
+        _create_table_on(shard)
+
+
+def insert_document(content, embedding, collection: Optional[str] = None):
+    shard = get_shards()[shard_for(content, collection)]
+    conn = get_db_connection(shard=shard)
     cursor = conn.cursor()
     cursor.execute(
         "INSERT INTO documents (content, embedding) VALUES (%s, %s)",
@@ -53,48 +133,90 @@ def insert_document(content, embedding):
 
 
 def truncate_documents_table() -> None:
-    conn = get_db_connection(register=False)
-    cursor = conn.cursor()
-    cursor.execute("TRUNCATE TABLE documents RESTART IDENTITY;")
-    conn.commit()
-    cursor.close()
-    conn.close()
+    for shard in get_shards():
+        conn = get_db_connection(register=False, shard=shard)
+        cursor = conn.cursor()
+        cursor.execute("TRUNCATE TABLE documents RESTART IDENTITY;")
+        conn.commit()
+        cursor.close()
+        conn.close()
+
+
+def _query_shard(shard, sql: str, params, register: bool, timeout: float):
+    conn = get_db_connection(register=register, shard=shard, timeout=timeout)
+    try:
+        cursor = conn.cursor()
+        cursor.execute(sql, params)
+        results = cursor.fetchall()
+        cursor.close()
+        return results
+    finally:
+        conn.close()
+
+
+def _scatter_gather(sql: str, params, limit: int, *, descending: bool, register: bool = True):
+    """Run `sql` on every shard in parallel and merge the per-shard top-k.
+
+    Rows are (id, content, score). Shards that fail or exceed DB_SHARD_TIMEOUT
+    are skipped with a warning; an error is raised only if every shard fails.
+    """
+    shards = get_shards()
+    n_shards = len(shards)
+    if n_shards == 1:
+        return _query_shard(shards[0], sql, params, register, timeout=None)
+
+    timeout = _shard_timeout()
+    pool = ThreadPoolExecutor(max_workers=n_shards)
+    futures = {
+        pool.submit(_query_shard, shard, sql, params, register, timeout): i
+        for i, shard in enumerate(shards)
+    }
+    done, not_done = wait(futures, timeout=timeout)
+    pool.shutdown(wait=False)
+
+    rows = []
+    errors = []
+    for future in done:
+        i = futures[future]
+        try:
+            shard_rows = future.result()
+        except Exception as e:
+            errors.append(e)
+            logger.warning("Shard %s falhou: %s", shards[i]["host"], e)
+            continue
+        rows.extend((_global_id(r[0], i, n_shards), r[1], r[2]) for r in shard_rows)
+    for future in not_done:
+        logger.warning("Shard %s excedeu o timeout de %ss", shards[futures[future]]["host"], timeout)
+
+    if not rows and len(errors) + len(not_done) == n_shards:
+        raise RuntimeError(f"Nenhum shard respondeu à busca ({len(errors)} erros, {len(not_done)} timeouts)")
+
+    pick = heapq.nlargest if descending else heapq.nsmallest
+    return pick(int(limit), rows, key=lambda r: r[2])
 
 def search_l2(query_embedding, limit=5):
-    conn = get_db_connection()
-    cursor = conn.cursor()
-    cursor.execute(
+    return _scatter_gather(
         "SELECT id, content, (embedding <-> %s) AS distance FROM documents ORDER BY distance ASC LIMIT %s",
         (Vector(query_embedding), limit),
+        limit,
+        descending=False,
     )
-    results = cursor.fetchall()
-    cursor.close()
-    conn.close()
-    return results
 
 def search_inner_product(query_embedding, limit=5):
-    conn = get_db_connection()
-    cursor = conn.cursor()
-    cursor.execute(
+    return _scatter_gather(
         "SELECT id, content, ((embedding <#> %s) * -1) AS similarity FROM documents ORDER BY similarity DESC LIMIT %s",
         (Vector(query_embedding), limit),
+        limit,
+        descending=True,
     )
-    results = cursor.fetchall()
-    cursor.close()
-    conn.close()
-    return results
 
 def search_cosine_similarity(query_embedding, limit=5):
-    conn = get_db_connection()
-    cursor = conn.cursor()
-    cursor.execute(
+    return _scatter_gather(
         "SELECT id, content, (1 - (embedding <=> %s)) AS similarity FROM documents ORDER BY similarity DESC LIMIT %s",
         (Vector(query_embedding), limit),
+        limit,
+        descending=True,
     )
-    results = cursor.fetchall()
-    cursor.close()
-    conn.close()
-    return results
 
 
 def search_full_text(query: str, limit: int = 5):
@@ -102,9 +224,7 @@ def search_full_text(query: str, limit: int = 5):
 
     Returns (id, content, score) where score is ts_rank.
     """
-    conn = get_db_connection(register=False)
-    cursor = conn.cursor()
-    cursor.execute(
+    return _scatter_gather(
         """
         SELECT
             id,
@@ -116,8 +236,7 @@ def search_full_text(query: str, limit: int = 5):
         LIMIT %s
         """,
         (query, query, limit),
+        limit,
+        descending=True,
+        register=False,
     )
-    results = cursor.fetchall()
-    cursor.close()
-    conn.close()
-    return results
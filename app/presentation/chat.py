@@ -1,16 +1,20 @@
 import streamlit as st
 
+from app.presentation.ingest_log import log_download_button
+
 def chat_interface():
     st.header("Chat")
 
     if "messages" not in st.session_state:
         st.session_state.messages = []
 
-    for message in st.session_state.messages:
+    for i, message in enumerate(st.session_state.messages):
         with st.chat_message(message["role"]):
             content = message.get("content", "")
             footer = message.get("footer", "")
             st.markdown(f"{content}{footer}")
+            if message.get("log"):
+                log_download_button(message["log"], key=f"ingest_log_{i}")
 
 
 def format_token_footer(input_tokens: int | None, output_tokens: int | None, total_tokens: int | None) -> str:
@@ -0,0 +1,88 @@
+import time
+from collections import deque
+from typing import List, Optional
+
+import streamlit as st
+
+from app.application.vectorization import IngestEvent
+
+
+class IngestLogView:
+    """Renders vectorization events without re-rendering the whole log per chunk.
+
+    Every event is kept in the full log (for download), but the placeholder only
+    shows aggregated counters plus a bounded tail of recent lines, and is redrawn
+    at most once every `min_interval` seconds.
+    """
+
+    def __init__(
+        self,
+        placeholder,
+        header_lines: List[str],
+        *,
+        tail_size: int = 20,
+        min_interval: float = 0.5,
+    ):
+        self.placeholder = placeholder
+        self.header_lines = list(header_lines)
+        self.min_interval = float(min_interval)
+        self.lines: List[str] = []
+        self.tail: deque = deque(maxlen=int(tail_size))
+        self.files: set = set()
+        self.documents = 0
+        self.chunks = 0
+        self.tokens = 0
+        self.api_tokens: Optional[int] = None
+        self._last_render = 0.0
+
+    def __call__(self, event: IngestEvent) -> None:
+        self.lines.append(event.message)
+        self.tail.append(event.message)
+
+        if event.kind == "document":
+            self.files.add(event.file)
+            self.documents += 1
+        elif event.kind == "chunk":
+            self.chunks += 1
+            self.tokens += event.tokens
+        elif event.kind == "summary" and event.api_tokens is not None:
+            self.api_tokens = (self.api_tokens or 0) + event.api_tokens
+
+        now = time.monotonic()
+        if now - self._last_render >= self.min_interval:
+            self._last_render = now
+            self.render()
+
+    def summary_markdown(self) -> str:
+        counters = (
+            f"**Arquivos:** {len(self.files)} | **Docs:** {self.documents} | "
+            f"**Chunks:** {self.chunks} | **Tokens (aprox):** `{self.tokens}`"
+        )
+        if self.api_tokens is not None:
+            counters += f" | **Tokens (API):** `{self.api_tokens}`"
+        return "\n".join(self.header_lines + [counters])
+
+    def render(self) -> None:
+        parts = [self.summary_markdown(), "---"]
+        hidden = len(self.lines) - len(self.tail)
+        if hidden > 0:
+            parts.append(f"_… {hidden} linhas anteriores omitidas (baixe o log completo)_")
+        parts.extend(self.tail)
+        self.placeholder.markdown("\n".join(parts))
+
+    def flush(self) -> None:
+        self._last_render = time.monotonic()
+        self.render()
+
+    def full_text(self) -> str:
+        return "\n".join(self.header_lines + ["---"] + self.lines)
+
+
+def log_download_button(log_text: str, key: str) -> None:
+    st.download_button(
+        "Baixar log completo",
+        data=log_text,
+        file_name="vetorizacao.log.md",
+        mime="text/markdown",
+        key=key,
+    )
@@ -2,6 +2,7 @@ import streamlit as st
 from app.presentation.sidebar import sidebar
 from app.presentation.chat import chat_interface, format_token_footer
 from app.presentation.progress import progress_bar
+from app.presentation.ingest_log import IngestLogView, log_download_button
 from app.application.vectorization import process_uploaded_files
 from app.application.search import get_search_strategy, search
 from app.infrastructure.llm import get_llm_client
@@ -32,31 +33,33 @@ def main():
         if st.sidebar.button("Iniciar Vetorização"):
             progress, progress_text = progress_bar(in_sidebar=True, show_header=False, show_text=False)
             with st.chat_message("assistant"):
-                log_placeholder = st.empty()
-                log_lines: list[str] = [
-                    "### Vetorização (chunk + embeddings)",
-                    f"Modelo de embedding: `{sidebar_configs['embedding_model']}`",
-                    "---",
-                ]
+                ingest_log = IngestLogView(
+                    st.empty(),
+                    [
+                        "### Vetorização (chunk + embeddings)",
+                        f"Modelo de embedding: `{sidebar_configs['embedding_model']}`",
+                    ],
+                )
 
-                def log_fn(line: str) -> None:
-                    log_lines.append(line)
-                    log_placeholder.markdown("\n".join(log_lines))
+                process_uploaded_files(
+                    sidebar_configs["uploaded_files"],
+                    sidebar_configs["chunk_size"],
+                    sidebar_configs["overlap"],
+                    sidebar_configs["embedding_model"],
+                    progress,
+                    progress_text,
+                    event_fn=ingest_log,
+                )
+                ingest_log.flush()
 
-            process_uploaded_files(
-                sidebar_configs["uploaded_files"],
-                sidebar_configs["chunk_size"],
-                sidebar_configs["overlap"],
-                sidebar_configs["embedding_model"],
-                progress,
-                progress_text,
-                log_fn=log_fn,
-            )
+                log_text = ingest_log.full_text()
+                log_download_button(log_text, key=f"ingest_log_{len(st.session_state.messages)}")
 
             st.session_state.messages.append(
                 {
                     "role": "assistant",
-                    "content": "\n".join(log_lines),
+                    "content": ingest_log.summary_markdown(),
+                    "log": log_text,
                 }
             )
 